@@ -170,12 +170,20 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    """Drop all tables."""
-    op.drop_table('game_sessions')
-    op.drop_table('game_states')
-    op.drop_table('game_room_participants')
-    op.drop_table('game_rooms')
-    op.drop_table('ai_agents')
-    op.drop_table('sessions')
-    op.drop_table('player_profiles')
-    op.drop_table('players')
+    """Drop all tables.
+
+    Uses DROP TABLE IF EXISTS so a downgrade interrupted part-way (MySQL
+    DDL is not transactional) can simply be re-run. Indexes go with
+    their tables.
+    """
+    for table in (
+        'game_sessions',
+        'game_states',
+        'game_room_participants',
+        'game_rooms',
+        'ai_agents',
+        'sessions',
+        'player_profiles',
+        'players',
+    ):
+        op.execute(f'DROP TABLE IF EXISTS {table}')
@@ -0,0 +1,118 @@
+"""Store UUID keys as fixed-width ASCII on MySQL.
+
+Revision ID: 002_ascii_uuid_keys
+Revises: 20251126_single_user
+Create Date: 2026-10-18
+
+Every primary and foreign key is a string UUID declared as String(36),
+which MySQL creates as VARCHAR(36) in the table's utf8mb4 charset. That
+reserves 4 bytes per character in index entries and compares keys with
+a collation-aware routine on every lookup and join.
+
+UUIDs are ASCII-only and fixed length, so this migration converts the key
+columns to CHAR(36) CHARACTER SET ascii COLLATE ascii_bin: index entries
+shrink to 36 bytes and comparisons become a plain memcmp. The application
+keeps passing ``str(uuid4())`` values, so no code changes are needed.
+
+sessions.id is referenced by game_room_participants.session_id, which is
+wider (VARCHAR(128)); it is converted to the same charset/collation so the
+foreign key remains valid.
+
+Other dialects are left untouched.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002_ascii_uuid_keys'
+down_revision: Union[str, None] = '20251126_single_user'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ASCII_UUID = "CHAR(36) CHARACTER SET ascii COLLATE ascii_bin"
+ASCII_SESSION_REF = "VARCHAR(128) CHARACTER SET ascii COLLATE ascii_bin"
+
+# table -> [(column, new type, old type, nullable)]
+KEY_COLUMNS = {
+    'players': [
+        ('id', ASCII_UUID, 'VARCHAR(36)', False),
+    ],
+    'player_profiles': [
+        ('player_id', ASCII_UUID, 'VARCHAR(36)', False),
+    ],
+    'sessions': [
+        ('id', ASCII_UUID, 'VARCHAR(36)', False),
+    ],
+    'ai_agents': [
+        ('id', ASCII_UUID, 'VARCHAR(36)', False),
+    ],
+    'game_rooms': [
+        ('id', ASCII_UUID, 'VARCHAR(36)', False),
+    ],
+    'game_room_participants': [
+        ('id', ASCII_UUID, 'VARCHAR(36)', False),
+        ('game_room_id', ASCII_UUID, 'VARCHAR(36)', False),
+        ('player_id', ASCII_UUID, 'VARCHAR(36)', True),
+        ('session_id', ASCII_SESSION_REF, 'VARCHAR(128)', True),
+    ],
+    'game_states': [
+        ('id', ASCII_UUID, 'VARCHAR(36)', False),
+        ('game_room_id', ASCII_UUID, 'VARCHAR(36)', False),
+        ('current_turn_player_id', ASCII_UUID, 'VARCHAR(36)', True),
+    ],
+    'game_sessions': [
+        ('id', ASCII_UUID, 'VARCHAR(36)', False),
+        ('game_room_id', ASCII_UUID, 'VARCHAR(36)', False),
+    ],
+}
+
+
+def _is_mysql() -> bool:
+    return op.get_context().dialect.name == 'mysql'
+
+
+def _modify_columns(table: str, columns: list[tuple[str, str, bool]]) -> None:
+    """Change several columns of one table in a single ALTER TABLE.
+
+    Each separate ALTER may rebuild the table on MySQL; grouping the
+    MODIFY clauses means one lock acquisition and at most one rebuild
+    per table.
+    """
+    clauses = ", ".join(
+        f"MODIFY {column} {type_} {'NULL' if nullable else 'NOT NULL'}"
+        for column, type_, nullable in columns
+    )
+    op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def upgrade() -> None:
+    """Convert UUID key columns to CHAR(36) ascii_bin."""
+    if not _is_mysql():
+        return
+
+    # Parent and child columns of each foreign key live in different
+    # tables, so the charsets briefly disagree; MySQL only allows that
+    # with foreign key checks disabled.
+    op.execute('SET FOREIGN_KEY_CHECKS = 0')
+    for table, columns in KEY_COLUMNS.items():
+        _modify_columns(
+            table,
+            [(column, new_type, nullable) for column, new_type, _, nullable in columns],
+        )
+    op.execute('SET FOREIGN_KEY_CHECKS = 1')
+
+
+def downgrade() -> None:
+    """Restore UUID key columns to the table's default charset."""
+    if not _is_mysql():
+        return
+
+    op.execute('SET FOREIGN_KEY_CHECKS = 0')
+    for table, columns in reversed(KEY_COLUMNS.items()):
+        _modify_columns(
+            table,
+            [(column, old_type, nullable) for column, _, old_type, nullable in columns],
+        )
+    op.execute('SET FOREIGN_KEY_CHECKS = 1')
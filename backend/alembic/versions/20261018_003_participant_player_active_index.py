@@ -0,0 +1,63 @@
+"""Index active participations by player.
+
+Revision ID: 003_participant_player_active
+Revises: 002_ascii_uuid_keys
+Create Date: 2026-10-18
+
+The disconnect handler looks up a player's active participations with
+``player_id = ? AND left_at IS NULL`` and joins the rooms through
+``game_room_id``. The single-column ``idx_participants_player`` narrows by
+player only, so every historical participation row is fetched to test
+``left_at``.
+
+This replaces it with ``(player_id, left_at, game_room_id)``: the filter is
+resolved entirely in the index and the join key is read from the index
+leaf. The new index still leads with ``player_id``, so it continues to back
+the foreign key to ``players``.
+
+On MySQL the swap is a single online ALTER (INPLACE, no lock) so writers
+are not blocked while the index builds.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_participant_player_active'
+down_revision: Union[str, None] = '002_ascii_uuid_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace idx_participants_player with a composite index."""
+    if op.get_context().dialect.name == 'mysql':
+        op.execute(
+            "ALTER TABLE game_room_participants "
+            "ADD INDEX idx_participants_player_active (player_id, left_at, game_room_id), "
+            "DROP INDEX idx_participants_player, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    op.create_index(
+        'idx_participants_player_active',
+        'game_room_participants',
+        ['player_id', 'left_at', 'game_room_id'],
+    )
+    op.drop_index('idx_participants_player', table_name='game_room_participants')
+
+
+def downgrade() -> None:
+    """Restore the single-column player index."""
+    if op.get_context().dialect.name == 'mysql':
+        op.execute(
+            "ALTER TABLE game_room_participants "
+            "ADD INDEX idx_participants_player (player_id), "
+            "DROP INDEX idx_participants_player_active, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    op.create_index('idx_participants_player', 'game_room_participants', ['player_id'])
+    op.drop_index('idx_participants_player_active', table_name='game_room_participants')
@@ -0,0 +1,99 @@
+"""Maintain game_rooms.current_participant_count with triggers.
+
+Revision ID: 004_participant_count_triggers
+Revises: 003_participant_player_active
+Create Date: 2026-10-18
+
+``game_rooms.current_participant_count`` is a denormalized count of the
+room's active participants (``left_at IS NULL``), used for the capacity
+check when adding AI agents. Keeping it correct from application code
+means an extra UPDATE round-trip on every join/leave, and any code path
+that forgets to do it leaves the counter stale.
+
+This migration moves maintenance into the database with three row-level
+triggers on ``game_room_participants``:
+
+- AFTER INSERT: +1 if the new row is active
+- AFTER UPDATE: +1/-1 when ``left_at`` flips between NULL and NOT NULL
+- AFTER DELETE: -1 if the deleted row was active
+
+Each trigger is a single-statement body, so no DELIMITER handling is
+needed. Existing rooms are backfilled once with a single grouped pass
+over participants joined back to ``game_rooms``, rather than a
+correlated COUNT per room.
+
+Note: with binary logging enabled, creating triggers requires the
+TRIGGER privilege plus SUPER or ``log_bin_trust_function_creators=1``.
+
+Other dialects are left untouched.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_participant_count_triggers'
+down_revision: Union[str, None] = '003_participant_player_active'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGGERS = {
+    'trg_participants_after_insert': """
+        CREATE TRIGGER trg_participants_after_insert
+        AFTER INSERT ON game_room_participants
+        FOR EACH ROW
+        UPDATE game_rooms
+        SET current_participant_count = current_participant_count + 1
+        WHERE id = NEW.game_room_id AND NEW.left_at IS NULL
+    """,
+    'trg_participants_after_update': """
+        CREATE TRIGGER trg_participants_after_update
+        AFTER UPDATE ON game_room_participants
+        FOR EACH ROW
+        UPDATE game_rooms
+        SET current_participant_count = current_participant_count
+            + (NEW.left_at IS NULL) - (OLD.left_at IS NULL)
+        WHERE id = NEW.game_room_id
+          AND (NEW.left_at IS NULL) <> (OLD.left_at IS NULL)
+    """,
+    'trg_participants_after_delete': """
+        CREATE TRIGGER trg_participants_after_delete
+        AFTER DELETE ON game_room_participants
+        FOR EACH ROW
+        UPDATE game_rooms
+        SET current_participant_count = current_participant_count - 1
+        WHERE id = OLD.game_room_id AND OLD.left_at IS NULL
+    """,
+}
+
+
+def upgrade() -> None:
+    """Backfill the counter and install the maintenance triggers."""
+    if op.get_context().dialect.name != 'mysql':
+        return
+
+    op.execute(
+        """
+        UPDATE game_rooms r
+        LEFT JOIN (
+            SELECT game_room_id, COUNT(*) AS active_count
+            FROM game_room_participants
+            WHERE left_at IS NULL
+            GROUP BY game_room_id
+        ) a ON a.game_room_id = r.id
+        SET r.current_participant_count = COALESCE(a.active_count, 0)
+        """
+    )
+
+    for ddl in TRIGGERS.values():
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    """Drop the maintenance triggers."""
+    if op.get_context().dialect.name != 'mysql':
+        return
+
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
@@ -0,0 +1,62 @@
+"""Index participants by (game_room_id, player_id, left_at).
+
+Revision ID: 005_participant_room_player
+Revises: 004_participant_count_triggers
+Create Date: 2026-10-18
+
+Room membership checks (e.g. the lobby join handler) look up
+``game_room_id = ? AND player_id = ? AND left_at IS NULL``. The
+single-column ``idx_participants_game_room`` only narrows by room, so
+every participant of the room, including those who left, is fetched and
+filtered row by row.
+
+This replaces it with ``(game_room_id, player_id, left_at)``, which
+resolves the whole predicate in the index. Loading a room's participants
+(``game_room_id IN (...)``) uses the leading column as before, and the
+index still backs the foreign key to ``game_rooms``.
+
+On MySQL the swap is a single online ALTER (INPLACE, no lock).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005_participant_room_player'
+down_revision: Union[str, None] = '004_participant_count_triggers'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace idx_participants_game_room with a composite index."""
+    if op.get_context().dialect.name == 'mysql':
+        op.execute(
+            "ALTER TABLE game_room_participants "
+            "ADD INDEX idx_participants_room_player (game_room_id, player_id, left_at), "
+            "DROP INDEX idx_participants_game_room, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    op.create_index(
+        'idx_participants_room_player',
+        'game_room_participants',
+        ['game_room_id', 'player_id', 'left_at'],
+    )
+    op.drop_index('idx_participants_game_room', table_name='game_room_participants')
+
+
+def downgrade() -> None:
+    """Restore the single-column room index."""
+    if op.get_context().dialect.name == 'mysql':
+        op.execute(
+            "ALTER TABLE game_room_participants "
+            "ADD INDEX idx_participants_game_room (game_room_id), "
+            "DROP INDEX idx_participants_room_player, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    op.create_index('idx_participants_game_room', 'game_room_participants', ['game_room_id'])
+    op.drop_index('idx_participants_room_player', table_name='game_room_participants')
@@ -0,0 +1,55 @@
+"""Index guest players by expiry.
+
+Revision ID: 006_players_guest_expires
+Revises: 005_participant_room_player
+Create Date: 2026-10-18
+
+Expired guest accounts are found with
+``is_guest = 1 AND expires_at < ?``. ``idx_players_is_guest`` indexes a
+boolean, so it matches roughly half the table and MySQL either ignores it
+or walks every guest row to test ``expires_at``.
+
+This replaces it with ``(is_guest, expires_at)``, turning the lookup (and
+a DELETE with the same predicate) into a range scan over the expired
+subset only. Queries filtering on ``is_guest`` alone can still use the
+leading column.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006_players_guest_expires'
+down_revision: Union[str, None] = '005_participant_room_player'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace idx_players_is_guest with a composite index."""
+    if op.get_context().dialect.name == 'mysql':
+        op.execute(
+            "ALTER TABLE players "
+            "ADD INDEX idx_players_guest_expires (is_guest, expires_at), "
+            "DROP INDEX idx_players_is_guest, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    op.create_index('idx_players_guest_expires', 'players', ['is_guest', 'expires_at'])
+    op.drop_index('idx_players_is_guest', table_name='players')
+
+
+def downgrade() -> None:
+    """Restore the single-column guest index."""
+    if op.get_context().dialect.name == 'mysql':
+        op.execute(
+            "ALTER TABLE players "
+            "ADD INDEX idx_players_is_guest (is_guest), "
+            "DROP INDEX idx_players_guest_expires, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    op.create_index('idx_players_is_guest', 'players', ['is_guest'])
+    op.drop_index('idx_players_guest_expires', table_name='players')
@@ -0,0 +1,54 @@
+"""Index game rooms by (status, created_at) for the lobby listing.
+
+Revision ID: 007_game_rooms_status_created
+Revises: 006_players_guest_expires
+Create Date: 2026-10-18
+
+The room list runs ``WHERE status = ? ORDER BY created_at DESC LIMIT n``.
+With only ``idx_game_rooms_status`` MySQL reads every room in that status
+(including all completed rooms over time) and filesorts them to return
+the first page.
+
+This replaces it with ``(status, created_at)``: the page is read from the
+end of the matching index range in order and the scan stops after
+``n`` rows. Filters on ``status`` alone still use the leading column.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_game_rooms_status_created'
+down_revision: Union[str, None] = '006_players_guest_expires'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace idx_game_rooms_status with a composite index."""
+    if op.get_context().dialect.name == 'mysql':
+        op.execute(
+            "ALTER TABLE game_rooms "
+            "ADD INDEX idx_game_rooms_status_created (status, created_at), "
+            "DROP INDEX idx_game_rooms_status, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    op.create_index('idx_game_rooms_status_created', 'game_rooms', ['status', 'created_at'])
+    op.drop_index('idx_game_rooms_status', table_name='game_rooms')
+
+
+def downgrade() -> None:
+    """Restore the single-column status index."""
+    if op.get_context().dialect.name == 'mysql':
+        op.execute(
+            "ALTER TABLE game_rooms "
+            "ADD INDEX idx_game_rooms_status (status), "
+            "DROP INDEX idx_game_rooms_status_created, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        return
+
+    op.create_index('idx_game_rooms_status', 'game_rooms', ['status'])
+    op.drop_index('idx_game_rooms_status_created', table_name='game_rooms')
@@ -0,0 +1,36 @@
+"""Drop the redundant game_states.game_room_id index.
+
+Revision ID: 008_drop_game_states_room_idx
+Revises: 007_game_rooms_status_created
+Create Date: 2026-10-18
+
+``game_states.game_room_id`` is declared ``unique=True``, so MySQL already
+keeps a unique index on it (named after the column). The explicit
+``idx_game_states_game_room`` duplicates that index: every game state
+write maintains two identical B-trees and the optimizer has an extra
+candidate to weigh on each lookup.
+
+The state lookup (``WHERE game_room_id = ?``) loads the whole row,
+including the ``game_data`` JSON, so a wider covering index would not
+avoid the clustered-index read either; the unique index is sufficient.
+The foreign key to ``game_rooms`` keeps using the unique index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008_drop_game_states_room_idx'
+down_revision: Union[str, None] = '007_game_rooms_status_created'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop idx_game_states_game_room."""
+    op.drop_index('idx_game_states_game_room', table_name='game_states')
+
+
+def downgrade() -> None:
+    """Recreate idx_game_states_game_room."""
+    op.create_index('idx_game_states_game_room', 'game_states', ['game_room_id'])
@@ -1,13 +1,16 @@
 """FastAPI application entry point."""
 from contextlib import asynccontextmanager
+from datetime import datetime
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, Response
+import orjson
 import socketio
 
-from src.database import init_db
+from src.database import close_db, init_db
 from src.utils.config import settings, HealthResponse
+from src.utils.cors import APICORSMiddleware
 from src.utils.logging_config import setup_logging
+from src.utils.responses import ORJSONResponse
 from src.websocket.server import sio
 
 # Initialize logging immediately on import
@@ -24,7 +27,7 @@ async def lifespan(app: FastAPI):
     await init_db()
     yield
     # Shutdown
-    pass
+    await close_db()
 
 
 # Create FastAPI app
@@ -32,49 +35,62 @@ app = FastAPI(
     title="Single-User Tabletop Game Platform",
     description="Backend API for single-user tabletop games with AI agents",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
-origins = settings.CORS_ORIGINS.split(",")
+# 启动时解析一次，去掉逗号两侧的空白
+CORS_ORIGINS = tuple(
+    origin.strip() for origin in settings.CORS_ORIGINS.split(",") if origin.strip()
+)
+# Socket.IO 挂载在 /socket.io 下，跨域规则由 sio 的 cors_allowed_origins
+# 决定，这里跳过该前缀
+SOCKETIO_PATH = "/socket.io"
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
+    APICORSMiddleware,
+    excluded_prefixes=(SOCKETIO_PATH,),
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+# 健康检查中不变的字段，只在导入时构建一次
+_STATIC_HEALTH = HealthResponse().model_dump(exclude={"timestamp"})
+
+
 @app.get("/api/v1/health", response_model=HealthResponse, tags=["System"])
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse()
+    return {**_STATIC_HEALTH, "timestamp": datetime.utcnow()}
+
+
+# 根路径响应内容固定，导入时序列化一次
+_ROOT_BODY = orjson.dumps({
+    "message": "Single-User Tabletop Game Platform API",
+    "version": "1.0.0",
+    "docs": "/docs"
+})
 
 
 @app.get("/", tags=["System"])
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Single-User Tabletop Game Platform API",
-        "version": "1.0.0",
-        "docs": "/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-# Import and include merged API routers
-from src.api import game_routes, user_routes, monitoring, werewolf_routes
+# Include all API routers (composed in src/api/__init__.py)
+from src.api import api_router
 
-# Include merged routers
-app.include_router(game_routes.router)
-app.include_router(user_routes.router)
-app.include_router(monitoring.router)
-app.include_router(werewolf_routes.router)
+app.include_router(api_router)
 
 # Mount Socket.IO app
-socket_app = socketio.ASGIApp(sio, app)
-
-# Export socket_app as app for uvicorn
-# uvicorn will use this ASGI application
-app = socket_app
+# 挂载在 /socket.io 下，由 FastAPI 路由按前缀分发；普通 HTTP 请求
+# 不再先经过 Socket.IO 的路径判断。挂载后 scope["path"] 仍是完整路径，
+# 与 engineio 默认的 socketio_path 匹配。
+app.mount(SOCKETIO_PATH, socketio.ASGIApp(sio))
 
+# Backwards-compatible alias (start.sh runs main:socket_app)
+socket_app = app
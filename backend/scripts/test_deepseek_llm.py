@@ -9,12 +9,20 @@ Usage:
 
 The script sends a simple prompt and prints the response. This is useful for validating
 that Deepseek (or any OpenAI-compatible provider) is reachable and that the API key/base URL are correctly configured.
+It then sends a small batch of prompts sequentially and concurrently (generate_many) and
+prints the wall-clock time of each.
 """
 import asyncio
 import sys
-from src.integrations.llm_client import LLMClient
+import time
+from src.integrations.llm_client import get_llm_client
 from src.utils.config import settings
 
+# Overall deadline for the connectivity check. The client's own timeout
+# (AI_TIMEOUT) applies per attempt and is retried AI_MAX_RETRIES times, so
+# a hung endpoint could otherwise block the script for several minutes.
+CHECK_TIMEOUT_SECONDS = 30
+
 async def main():
     if not settings.effective_ai_api_key:
         print("No AI API key configured. Set AI_API_KEY or OPENAI_API_KEY in environment/.env")
@@ -24,7 +32,7 @@ async def main():
         print("No AI_API_BASE_URL configured. Set AI_API_BASE_URL to point to your OpenAI-compatible provider (Deepseek) if needed.")
         print("If your provider is the public OpenAI API, this may be left blank.")
 
-    client = LLMClient()
+    client = get_llm_client()
 
     prompt_messages = [
         {"role": "system", "content": "You are a helpful assistant that replies in short sentences."},
@@ -33,10 +41,45 @@ async def main():
 
     try:
         print("Sending test prompt...")
-        resp = await client.generate(prompt_messages)
+        resp = await asyncio.wait_for(
+            client.generate(prompt_messages), timeout=CHECK_TIMEOUT_SECONDS
+        )
         print("Response:\n", resp)
+    except asyncio.TimeoutError:
+        print(f"LLM request timed out after {CHECK_TIMEOUT_SECONDS}s")
+        return
     except Exception as e:
         print("LLM request failed:", e)
+        return
+
+    batch = [
+        [
+            prompt_messages[0],
+            {"role": "user", "content": f"What's {i} + {i}?"},
+        ]
+        for i in range(1, 9)
+    ]
+
+    async def run_sequential():
+        for messages in batch:
+            await client.generate(messages)
+
+    try:
+        start = time.perf_counter()
+        await asyncio.wait_for(run_sequential(), timeout=CHECK_TIMEOUT_SECONDS * len(batch))
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await asyncio.wait_for(
+            client.generate_many(batch, concurrency=8), timeout=CHECK_TIMEOUT_SECONDS
+        )
+        concurrent = time.perf_counter() - start
+
+        print(f"{len(batch)} prompts: sequential {sequential:.2f}s, concurrent {concurrent:.2f}s")
+    except asyncio.TimeoutError:
+        print("Batch LLM request timed out")
+    except Exception as e:
+        print("Batch LLM request failed:", e)
 
 if __name__ == '__main__':
     asyncio.run(main())
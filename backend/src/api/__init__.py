@@ -1,11 +1,17 @@
-"""API routers initialization."""
+"""API routers initialization.
+
+All HTTP routers are composed into ``api_router`` once at import time;
+``main.py`` includes it on the app with a single ``include_router`` call.
+Each router declares its own paths/prefix and tags.
+"""
 from fastapi import APIRouter
 
+from src.api import game_routes, monitoring, user_routes, werewolf_routes
+
 # Base router for API v1
 api_router = APIRouter()
 
-# Routers will be imported and included here
-# from src.api import players, games, rooms
-# api_router.include_router(players.router, prefix="/players", tags=["players"])
-# api_router.include_router(games.router, prefix="/games", tags=["games"])
-# api_router.include_router(rooms.router, prefix="/rooms", tags=["rooms"])
+api_router.include_router(game_routes.router)
+api_router.include_router(user_routes.router)
+api_router.include_router(monitoring.router)
+api_router.include_router(werewolf_routes.router)
@@ -7,11 +7,15 @@ This module consolidates all game-related REST API endpoints:
 - Role selection (单人模式)
 - Game control (pause/resume/stop)
 """
+import hashlib
 import logging
+from datetime import datetime
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas import (
@@ -27,11 +31,13 @@ from src.api.schemas import (
     RoomListResponse,
     SelectRoleRequest,
 )
-from src.constants import GAME_TYPES, get_game_type_by_slug, ROLES_BY_GAME, get_roles_by_game_slug
+from src.constants import GAME_TYPES, ROLES_BY_GAME, get_roles_by_game_slug
 from src.database import get_db
+from src.models.game import GameRoomParticipant
+from src.models.user import Player
 from src.services.ai_service import AIAgentService
-from src.services.game_room_service import GameRoomService
-from src.utils.errors import APIError, NotFoundError
+from src.services.game_room_service import GameRoomService, encode_room_cursor
+from src.utils.errors import APIError, GameAlreadyStartedError, NotFoundError, RoomFullError
 from src.websocket import handlers as ws_handlers
 
 logger = logging.getLogger(__name__)
@@ -39,58 +45,175 @@ logger = logging.getLogger(__name__)
 # Create router with combined game routes
 router = APIRouter(tags=["games"])
 
+# 游戏类型/角色都是静态常量：响应在导入时构建并序列化为 JSON 字节，
+# 请求中直接返回，不再逐次校验和编码
+_GAME_TYPE_LIST_ADAPTER = TypeAdapter(List[GameTypeResponse])
+_ROLE_LIST_ADAPTER = TypeAdapter(RoleListResponse)
+
+_GAME_TYPE_RESPONSES = {game["slug"]: GameTypeResponse(**game) for game in GAME_TYPES}
+
+# available_only -> serialized game type list
+_GAME_TYPE_LIST_BODIES = {
+    False: _GAME_TYPE_LIST_ADAPTER.dump_json(list(_GAME_TYPE_RESPONSES.values())),
+    True: _GAME_TYPE_LIST_ADAPTER.dump_json(
+        [g for g in _GAME_TYPE_RESPONSES.values() if g.is_available]
+    ),
+}
+
+# game slug -> serialized role list
+_ROLE_LIST_BODIES = {
+    game["slug"]: _ROLE_LIST_ADAPTER.dump_json(
+        RoleListResponse(
+            roles=[RoleResponse(**r) for r in get_roles_by_game_slug(game["slug"]) or []],
+            supports_spectating=game["supports_spectating"],
+        )
+    )
+    for game in GAME_TYPES
+}
+
+# game_started 广播中的 game_type 字段
+_GAME_TYPE_BROADCASTS = {
+    game["slug"]: {"name": game["name"], "slug": game["slug"]} for game in GAME_TYPES
+}
+
+# 房间端点直接返回序列化好的 JSON；FastAPI 对返回的 Response 不再
+# 按 response_model 重新校验和编码，response_model 仅用于生成文档
+_ROOM_DETAIL_ADAPTER = TypeAdapter(GameRoomDetailedResponse)
+_ROOM_LIST_ADAPTER = TypeAdapter(RoomListResponse)
+
+# 游戏类型列表在进程生命周期内不变，ETag 按序列化结果在导入时计算一次
+_GAME_LIST_CACHE_CONTROL = "public, max-age=60"
+
+_GAME_LIST_ETAGS = {
+    flag: f'"{hashlib.md5(body).hexdigest()}"'
+    for flag, body in _GAME_TYPE_LIST_BODIES.items()
+}
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match covers the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
 
+def _room_fields(room, current_player_count: int) -> dict:
+    """Fields shared by the summary and detailed room responses."""
+    return {
+        "id": room.id,
+        "code": room.code,
+        "status": room.status,
+        "max_players": room.max_players,
+        "min_players": room.min_players,
+        "created_at": room.created_at,
+        "started_at": room.started_at,
+        "completed_at": room.completed_at,
+        "game_type": _GAME_TYPE_RESPONSES.get(room.game_type_id),
+        "current_player_count": current_player_count,
+    }
+
+
+def _build_room_model(model, fields: dict):
+    """Build a room response model, skipping validation when it is safe.
+
+    ORM 数据已是正确类型，使用 model_construct 跳过逐字段校验；但游戏类型
+    slug 不在 GAME_TYPES 中时 game_type 为 None，不符合声明的 schema，
+    此时走完整校验，与之前一样报 ValidationError，而不是输出 null。
+    """
+    if fields["game_type"] is None:
+        return model(**fields)
+    return model.model_construct(**fields)
+
+
 def map_room_to_response(room) -> GameRoomResponse:
-    """Map GameRoom model to response schema."""
-    game_type = get_game_type_by_slug(room.game_type_id)
-    return GameRoomResponse(
-        id=room.id,
-        code=room.code,
-        status=room.status,
-        max_players=room.max_players,
-        min_players=room.min_players,
-        created_at=room.created_at,
-        started_at=room.started_at,
-        completed_at=room.completed_at,
-        game_type=game_type,
-        current_player_count=room.get_active_participants_count()
+    """Map a room list row to response schema.
+
+    The row must come from GameRoomService.list_rooms, which selects the
+    list columns and computes the active participant count in SQL.
+    """
+    return _build_room_model(
+        GameRoomResponse, _room_fields(room, room.active_participant_count)
     )
 
 
-def map_room_to_detailed_response(room) -> GameRoomDetailedResponse:
-    """Map GameRoom model to detailed response schema."""
-    game_type = get_game_type_by_slug(room.game_type_id)
-    participants = []
-    for p in room.participants:
-        participants.append(ParticipantResponse(
+def _player_response(player) -> PlayerResponse:
+    """Build a PlayerResponse from a loaded Player without re-validation.
+
+    ORM 数据已是正确类型，使用 model_construct 跳过逐字段校验。
+    """
+    return PlayerResponse.model_construct(
+        id=player.id,
+        username=player.username,
+        is_guest=player.is_guest,
+        created_at=player.created_at,
+        last_active=player.last_active,
+        expires_at=player.expires_at,
+    )
+
+
+def _serialize_participants(participants) -> list[ParticipantResponse]:
+    """Map participant models to response schemas."""
+    if not participants:
+        return []
+    return [
+        ParticipantResponse.model_construct(
             id=p.id,
-            player=PlayerResponse.from_orm(p.player) if p.player else None,
+            player=_player_response(p.player) if p.player else None,
             is_ai_agent=p.is_ai_agent,
             ai_personality=p.ai_personality,
             joined_at=p.joined_at,
             left_at=p.left_at,
             replaced_by_ai=p.replaced_by_ai
-        ))
-
-    return GameRoomDetailedResponse(
-        id=room.id,
-        code=room.code,
-        status=room.status,
-        max_players=room.max_players,
-        min_players=room.min_players,
-        created_at=room.created_at,
-        started_at=room.started_at,
-        completed_at=room.completed_at,
-        game_type=game_type,
-        current_player_count=room.get_active_participants_count(),
-        participants=participants,
-        user_role=room.user_role,
-        is_spectator_mode=room.is_spectator_mode
+        )
+        for p in participants
+    ]
+
+
+def map_room_to_detailed_response(
+    room,
+    active_count: int | None = None
+) -> GameRoomDetailedResponse:
+    """Map GameRoom model to detailed response schema.
+
+    Args:
+        room: Room with participants loaded
+        active_count: Active participant count, if the caller already has
+            it; otherwise counted from ``room.participants``
+    """
+    if active_count is None:
+        active_count = room.get_active_participants_count()
+    return _build_room_model(
+        GameRoomDetailedResponse,
+        {
+            **_room_fields(room, active_count),
+            "participants": _serialize_participants(room.participants),
+            "user_role": room.user_role,
+            "is_spectator_mode": room.is_spectator_mode,
+        },
+    )
+
+
+def _room_detail_json(
+    room,
+    status_code: int = 200,
+    active_count: int | None = None
+) -> Response:
+    """Serialize a room's detailed response straight to JSON bytes.
+
+    Returning a Response skips FastAPI's response_model validation and
+    encoding; the route's response_model is still used for OpenAPI.
+    """
+    return Response(
+        content=_ROOM_DETAIL_ADAPTER.dump_json(map_room_to_detailed_response(room, active_count)),
+        status_code=status_code,
+        media_type="application/json"
     )
 
 
@@ -100,21 +223,30 @@ def map_room_to_detailed_response(room) -> GameRoomDetailedResponse:
 
 @router.get("/api/v1/games", response_model=List[GameTypeResponse])
 async def list_games(
+    request: Request,
     available_only: bool = False,
 ):
     """List all game types.
     
+    The list is static, so responses carry an ETag and may be cached for
+    a short time; a matching If-None-Match gets 304 Not Modified.
+
     Args:
         available_only: If True, only return available games
         
     Returns:
         List of game types with details
     """
-    games = GAME_TYPES
-    if available_only:
-        games = [g for g in games if g["is_available"]]
-
-    return [GameTypeResponse(**game) for game in games]
+    etag = _GAME_LIST_ETAGS[available_only]
+    cache_headers = {"ETag": etag, "Cache-Control": _GAME_LIST_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    return Response(
+        content=_GAME_TYPE_LIST_BODIES[available_only],
+        media_type="application/json",
+        headers=cache_headers
+    )
 
 
 @router.get("/api/v1/games/{slug}", response_model=GameTypeResponse)
@@ -132,12 +264,12 @@ async def get_game_details(
     Raises:
         HTTPException: If game not found
     """
-    game = get_game_type_by_slug(slug)
+    game = _GAME_TYPE_RESPONSES.get(slug)
 
     if not game:
         raise HTTPException(status_code=404, detail=f"Game '{slug}' not found")
 
-    return GameTypeResponse(**game)
+    return game
 
 
 # =============================================================================
@@ -163,7 +295,7 @@ async def create_room(
             user_role=request.user_role,
             is_spectator_mode=request.is_spectator_mode,
         )
-        return map_room_to_detailed_response(room)
+        return _room_detail_json(room, status_code=201)
     except APIError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -173,19 +305,35 @@ async def list_rooms(
     status: str | None = Query(None),
     game_type: str | None = Query(None, alias="gameType"),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
-    """List game rooms with optional filtering."""
+    """List game rooms with optional filtering, newest first.
+
+    Pass ``next_cursor`` from a response as ``cursor`` to fetch the next
+    page. ``total`` is the number of matching rooms across all pages; it
+    is only computed for the first page (no ``cursor``) and is null on
+    later pages, so paging does not repeat a full COUNT.
+    """
     try:
         service = GameRoomService(db)
         rooms = await service.list_rooms(
             status=status,
             game_type_slug=game_type,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
-        return RoomListResponse(
+        total = None
+        if cursor is None:
+            total = await service.count_rooms(status=status, game_type_slug=game_type)
+        room_list = RoomListResponse(
             rooms=[map_room_to_response(room) for room in rooms],
-            total=len(rooms)
+            total=total,
+            next_cursor=encode_room_cursor(rooms[-1]) if len(rooms) == limit else None
+        )
+        return Response(
+            content=_ROOM_LIST_ADAPTER.dump_json(room_list),
+            media_type="application/json"
         )
     except APIError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
@@ -200,7 +348,7 @@ async def get_room(
     try:
         service = GameRoomService(db)
         room = await service.get_room(room_code)
-        return map_room_to_detailed_response(room)
+        return _room_detail_json(room)
     except APIError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -218,6 +366,7 @@ async def get_room(
 @router.post("/api/v1/rooms/{room_code}/ai-agents", status_code=201)
 async def add_ai_agent(
     room_code: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Add an AI agent to the room.
@@ -232,12 +381,10 @@ async def add_ai_agent(
 
         # Validate room status
         if room.status != "Waiting":
-            from src.utils.errors import GameAlreadyStartedError
             raise GameAlreadyStartedError("Cannot add AI agents after game starts")
 
         # Validate capacity
-        if room.current_participant_count >= room.max_players:
-            from src.utils.errors import RoomFullError
+        if room.get_active_participants_count() >= room.max_players:
             raise RoomFullError("Room is at maximum capacity")
 
         # Create AI agent
@@ -249,7 +396,7 @@ async def add_ai_agent(
             "username": participant.player.username,
             "is_ai": True
         }
-        await ws_handlers.broadcast_ai_agent_added(room_code, ai_data)
+        background_tasks.add_task(ws_handlers.broadcast_ai_agent_added, room_code, ai_data)
 
         # Return response
         return {
@@ -258,9 +405,9 @@ async def add_ai_agent(
                 "username": participant.player.username,
                 "is_guest": participant.player.is_guest,
                 "player_type": "ai",
-                "created_at": participant.joined_at.isoformat(),
-                "last_active": participant.player.last_active.isoformat(),
-                "expires_at": participant.player.expires_at.isoformat() if participant.player.expires_at else None
+                "created_at": participant.joined_at,
+                "last_active": participant.player.last_active,
+                "expires_at": participant.player.expires_at
             },
             "room_code": room_code
         }
@@ -272,6 +419,7 @@ async def add_ai_agent(
 async def remove_ai_agent(
     room_code: str,
     agent_id: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Remove an AI agent from the room.
@@ -286,7 +434,7 @@ async def remove_ai_agent(
 
         # Broadcast AI agent removed event
         # Note: We don't need AI name for this event as client has the ID
-        await ws_handlers.broadcast_ai_agent_removed(room_code, agent_id, None)
+        background_tasks.add_task(ws_handlers.broadcast_ai_agent_removed, room_code, agent_id, None)
 
         return Response(status_code=204)
     except APIError as e:
@@ -296,6 +444,7 @@ async def remove_ai_agent(
 @router.post("/api/v1/rooms/{room_code}/start", response_model=GameRoomDetailedResponse)
 async def start_game(
     room_code: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Start a game. Auto-fills empty slots with AI agents.
@@ -309,17 +458,14 @@ async def start_game(
         # Get room
         room = await room_service.get_room(room_code)
 
-        # Fill empty slots with AI agents
+        # Fill empty slots with AI agents (appended to room.participants)
         await ai_service.fill_empty_slots(room)
 
-        # Refresh room to get AI participants
-        await db.refresh(room)
-
         # Start game (no owner validation in single-player mode)
-        room = await room_service.start_game(room_code)
+        room = await room_service.start_game(room_code, room=room)
 
-        # Get game type from constants
-        game_type = get_game_type_by_slug(room.game_type_id)
+        # 活跃参与者只筛选一次，广播和响应计数共用
+        active_participants = [p for p in room.participants if p.is_active()]
 
         # Prepare game data for broadcast
         game_data = {
@@ -330,20 +476,19 @@ async def start_game(
                     "is_ai": p.is_ai_agent,
                     "personality": p.ai_personality
                 }
-                for p in room.participants if p.is_active()
+                for p in active_participants
             ],
-            "game_type": {
-                "name": game_type["name"] if game_type else "Unknown",
-                "slug": game_type["slug"] if game_type else room.game_type_id
-            },
+            "game_type": _GAME_TYPE_BROADCASTS.get(room.game_type_id)
+            or {"name": "Unknown", "slug": room.game_type_id},
+            # socket.io 使用标准库 json 编码，datetime 需转为字符串
             "started_at": room.started_at.isoformat() if room.started_at else None,
             "initial_state": None  # Will be populated by GameStateService in Phase 4
         }
 
-        # Broadcast game started event via WebSocket
-        await ws_handlers.broadcast_game_started(room_code, game_data)
+        # Broadcast game started event via WebSocket (after the response is sent)
+        background_tasks.add_task(ws_handlers.broadcast_game_started, room_code, game_data)
 
-        return map_room_to_detailed_response(room)
+        return _room_detail_json(room, active_count=len(active_participants))
     except APIError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -360,19 +505,12 @@ async def get_roles(
 
     单人模式下，用户可以选择扮演特定角色或作为旁观者。
     """
-    # Get game type from constants
-    game_type = get_game_type_by_slug(game_type_slug)
+    body = _ROLE_LIST_BODIES.get(game_type_slug)
 
-    if not game_type:
+    if body is None:
         raise HTTPException(status_code=404, detail=f"Game type '{game_type_slug}' not found")
 
-    # Load roles from constants
-    roles = get_roles_by_game_slug(game_type_slug) or []
-
-    return RoleListResponse(
-        roles=[RoleResponse(**r) for r in roles],
-        supports_spectating=game_type["supports_spectating"]
-    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/api/v1/rooms/{room_code}/select-role", response_model=GameRoomDetailedResponse)
@@ -386,15 +524,15 @@ async def select_role(
     单人模式下，用户选择角色后将锁定，游戏自动开始。
     """
     try:
-        from src.models.game import GameRoomParticipant
-        from src.models.user import Player
-
         service = GameRoomService(db)
         room = await service.get_room(room_code)
 
         if room.status != "Waiting":
             raise HTTPException(status_code=400, detail="Cannot select role after game starts")
 
+        # 活跃人数只统计一次，之后随新增参与者递增
+        active_count = room.get_active_participants_count()
+
         # Update room with user's role selection
         if request.is_spectator:
             room.user_role = "spectator"
@@ -418,52 +556,53 @@ async def select_role(
                 await db.flush()
 
             # Ensure human participant exists
-            has_human_participant = any(
-                (p.left_at is None and p.player_id == request.player_id and not p.is_ai_agent)
+            active_humans = {
+                p.player_id: p
                 for p in room.participants
-            )
+                if p.left_at is None and not p.is_ai_agent
+            }
+            has_human_participant = request.player_id in active_humans
             logger.info(
                 f"select_role check: room={room_code}, has_human_participant={has_human_participant}, "
-                f"player_id={request.player_id}, participant_count_before={room.get_active_participants_count()}"
+                f"player_id={request.player_id}, participant_count_before={active_count}"
             )
             if not has_human_participant:
                 human_participant = GameRoomParticipant(
                     game_room_id=room.id,
-                    player_id=human_player.id,
+                    player=human_player,
                     is_ai_agent=False,
                     is_owner=True,
                 )
-                db.add(human_participant)
+                room.participants.append(human_participant)
+                active_count += 1
                 logger.info(f"Created human participant for player_id={request.player_id} in room {room_code}")
 
-        await db.flush()  # Flush to database before commit
         await db.commit()
 
-        # Fill AI participants after role selection
-        # Expire the room object to force reload from database
-        db.expire(room)
-        room = await service.get_room(room_code)
-        current_count = room.get_active_participants_count()
+        # Fill AI participants after role selection.
+        # 新参与者已追加到 room.participants，无需 expire 后重新加载
         target_total = room.max_players
-        needed = target_total - current_count
+        needed = target_total - active_count
         
-        logger.info(
-            f"select_role AI fill: room={room_code}, current_count={current_count}, "
-            f"target_total={target_total}, needed={needed}, "
-            f"participants={[(p.player_id, p.is_ai_agent, p.left_at) for p in room.participants]}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"select_role AI fill: room={room_code}, current_count={active_count}, "
+                f"target_total={target_total}, needed={needed}, "
+                f"participants={[(p.player_id, p.is_ai_agent, p.left_at) for p in room.participants]}"
+            )
 
-        for i in range(needed):
+        if needed > 0:
+            # 批量创建只提交一次：失败时整体回滚，不会留下填充了一半的房间
             try:
-                await service.create_ai_agent(room.id)
-                logger.info(f"Created AI agent {i + 1}/{needed} for room {room_code}")
-            except Exception as e:
-                logger.warning("Failed to add AI agent: %s", e)
-                break
-
-        # Refresh room with all participants
-        room = await service.get_room(room_code)
-        return map_room_to_detailed_response(room)
+                await service.create_ai_agents_bulk(room, needed)
+            except SQLAlchemyError:
+                logger.error("Failed to add AI agents to room %s", room_code, exc_info=True)
+                await db.rollback()
+                raise HTTPException(status_code=500, detail="Failed to add AI agents")
+            active_count += needed
+            logger.info(f"Created {needed} AI agents for room {room_code}")
+
+        return _room_detail_json(room, active_count=active_count)
     except APIError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -475,6 +614,7 @@ async def select_role(
 @router.post("/api/v1/rooms/{room_code}/pause", response_model=GameControlResponse)
 async def pause_game(
     room_code: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Pause the current game.
@@ -483,17 +623,13 @@ async def pause_game(
     """
     try:
         service = GameRoomService(db)
-        room = await service.get_room(room_code)
-
-        if room.status != "In Progress":
-            raise HTTPException(status_code=400, detail="Game is not in progress")
 
         # Update status to Paused
-        room.status = "Paused"
-        await db.commit()
+        if not await service.update_status(room_code, ("In Progress",), "Paused"):
+            raise HTTPException(status_code=400, detail="Game is not in progress")
 
         # Broadcast pause event
-        await ws_handlers.broadcast_game_paused(room_code)
+        background_tasks.add_task(ws_handlers.broadcast_game_paused, room_code)
 
         return GameControlResponse(
             room_code=room_code,
@@ -507,6 +643,7 @@ async def pause_game(
 @router.post("/api/v1/rooms/{room_code}/resume", response_model=GameControlResponse)
 async def resume_game(
     room_code: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Resume a paused game.
@@ -515,17 +652,13 @@ async def resume_game(
     """
     try:
         service = GameRoomService(db)
-        room = await service.get_room(room_code)
-
-        if room.status != "Paused":
-            raise HTTPException(status_code=400, detail="Game is not paused")
 
         # Update status back to In Progress
-        room.status = "In Progress"
-        await db.commit()
+        if not await service.update_status(room_code, ("Paused",), "In Progress"):
+            raise HTTPException(status_code=400, detail="Game is not paused")
 
         # Broadcast resume event
-        await ws_handlers.broadcast_game_resumed(room_code)
+        background_tasks.add_task(ws_handlers.broadcast_game_resumed, room_code)
 
         return GameControlResponse(
             room_code=room_code,
@@ -539,6 +672,7 @@ async def resume_game(
 @router.post("/api/v1/rooms/{room_code}/stop", response_model=GameControlResponse)
 async def stop_game(
     room_code: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Stop the current game.
@@ -547,17 +681,19 @@ async def stop_game(
     """
     try:
         service = GameRoomService(db)
-        room = await service.get_room(room_code)
-
-        if room.status not in ["In Progress", "Paused"]:
-            raise HTTPException(status_code=400, detail="Game is not running")
 
         # Complete the game
-        room.complete()
-        await db.commit()
+        completed = await service.update_status(
+            room_code,
+            ("In Progress", "Paused"),
+            "Completed",
+            completed_at=datetime.utcnow(),
+        )
+        if not completed:
+            raise HTTPException(status_code=400, detail="Game is not running")
 
         # Broadcast stop event
-        await ws_handlers.broadcast_game_stopped(room_code)
+        background_tasks.add_task(ws_handlers.broadcast_game_stopped, room_code)
 
         return GameControlResponse(
             room_code=room_code,
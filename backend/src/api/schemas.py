@@ -89,7 +89,8 @@ class GameRoomDetailedResponse(GameRoomResponse):
 # Room list response
 class RoomListResponse(BaseModel):
     rooms: list[GameRoomResponse]
-    total: int
+    total: int | None = None  # 仅第一页返回（无 cursor 时）
+    next_cursor: str | None = None
 
 
 # 单人模式下移除了 JoinRoomResponse（无需加入房间功能）
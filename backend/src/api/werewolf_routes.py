@@ -117,7 +117,6 @@ async def quick_start_game(
             )
             db.add(ai_participant)
         
-        room.current_participant_count = 10
         await db.commit()
         await db.refresh(room, ["participants"])
         
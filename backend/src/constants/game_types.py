@@ -3,7 +3,7 @@
 This module contains static game type definitions that were previously stored in database.
 """
 
-from typing import List, Optional, TypedDict
+from typing import Dict, List, Optional, TypedDict
 
 
 class GameTypeDict(TypedDict):
@@ -62,6 +62,12 @@ GAME_TYPES: List[GameTypeDict] = [
 ]
 
 
+# Index by slug so lookups are O(1) instead of a scan over GAME_TYPES
+GAME_TYPES_BY_SLUG: Dict[str, GameTypeDict] = {
+    game_type["slug"]: game_type for game_type in GAME_TYPES
+}
+
+
 def get_game_type_by_slug(slug: str) -> Optional[GameTypeDict]:
     """Get a game type by its slug.
 
@@ -71,7 +77,4 @@ def get_game_type_by_slug(slug: str) -> Optional[GameTypeDict]:
     Returns:
         The game type dict if found, None otherwise.
     """
-    for game_type in GAME_TYPES:
-        if game_type["slug"] == slug:
-            return game_type
-    return None
+    return GAME_TYPES_BY_SLUG.get(slug)
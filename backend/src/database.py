@@ -1,16 +1,24 @@
 """Database configuration and session management."""
+import logging
+from contextlib import AsyncExitStack
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from src.utils.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create async engine with MySQL
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.SQLALCHEMY_ECHO,
-    pool_size=5,
-    max_overflow=10,
-    pool_recycle=3600,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
 )
 
 # Configure async session
@@ -37,5 +45,23 @@ async def get_db():
 
 
 async def init_db():
-    """Initialize database - no special initialization needed for MySQL."""
-    pass
+    """Warm up the connection pool at startup.
+
+    表结构由 Alembic 管理（部署时执行 ``alembic upgrade head``），这里不做
+    create_all 或反射。启动时预先建立 pool_size 个连接并归还连接池，
+    首个请求无需再承担建连/握手延迟。数据库暂不可用时只记录警告，不阻止启动。
+    """
+    size = engine.pool.size() if hasattr(engine.pool, "size") else 1
+    try:
+        async with AsyncExitStack() as stack:
+            for _ in range(size):
+                conn = await stack.enter_async_context(engine.connect())
+                await conn.execute(text("SELECT 1"))
+        logger.info("Database pool warmed up with %d connections", size)
+    except (SQLAlchemyError, OSError) as e:
+        logger.warning("Database pool warm-up failed: %s", e)
+
+
+async def close_db():
+    """Close all pooled connections on shutdown."""
+    await engine.dispose()
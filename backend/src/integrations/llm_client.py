@@ -1,5 +1,6 @@
 """LangChain LLM integration for AI agent decision-making."""
 
+import asyncio
 import logging
 import time
 from typing import Any, AsyncIterator, Optional
@@ -161,6 +162,39 @@ class LLMClient:
             )
             raise self._wrap_exception(e)
 
+    async def generate_many(
+        self,
+        batch_of_messages: list[list[dict[str, str]]],
+        concurrency: int = 8,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> list[str]:
+        """Generate responses for several independent prompts concurrently.
+
+        请求之间互不依赖，用信号量限制同时在途的请求数，避免触发服务商限流。
+
+        Args:
+            batch_of_messages: One message list per prompt, as for ``generate``.
+            concurrency: Maximum number of requests in flight at once.
+            temperature: Override default temperature.
+            max_tokens: Maximum tokens to generate.
+
+        Returns:
+            Generated text contents, in the same order as the input.
+
+        Raises:
+            LLMError: If any of the requests fails.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _generate(messages: list[dict[str, str]]) -> str:
+            async with semaphore:
+                return await self.generate(
+                    messages, temperature=temperature, max_tokens=max_tokens
+                )
+
+        return await asyncio.gather(*(_generate(m) for m in batch_of_messages))
+
     async def generate_stream(
         self,
         messages: list[dict[str, str]],
@@ -431,6 +465,22 @@ Choose one action and explain your reasoning. Return only the JSON response.
             return LLMError(f"LLM error: {error_msg}")
 
 
+# Global singleton instance
+_llm_client: Optional[LLMClient] = None
+
+
+def get_llm_client() -> LLMClient:
+    """Get the process-wide LLM client with default settings.
+
+    ChatOpenAI 内部持有 HTTP 连接池，所有默认配置的调用方共用同一个客户端，
+    避免每个 AI 代理/服务实例各自建连和握手。
+    """
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClient()
+    return _llm_client
+
+
 # Custom exceptions
 class LLMError(Exception):
     """Base exception for LLM errors."""
@@ -3,8 +3,19 @@ from datetime import datetime
 from uuid import uuid4
 
 from sqlalchemy import String
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# UUID 主键/外键列类型：MySQL 上为定长 ASCII，按字节比较（与迁移 002 一致）
+UUIDString = String(36).with_variant(
+    mysql.CHAR(36, charset="ascii", collation="ascii_bin"), "mysql"
+)
+
+# 引用 sessions.id 的外键列，宽度沿用 128，字符集与被引用列保持一致
+SessionRefString = String(128).with_variant(
+    mysql.VARCHAR(128, charset="ascii", collation="ascii_bin"), "mysql"
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -27,10 +38,10 @@ class TimestampMixin:
 
 
 class UUIDMixin:
-    """Mixin for UUID primary key (stored as String(36) for compatibility)."""
+    """Mixin for UUID primary key (stored as String(36); CHAR(36) ascii_bin on MySQL)."""
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDString,
         primary_key=True,
         default=lambda: str(uuid4())
     )
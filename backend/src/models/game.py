@@ -15,7 +15,7 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.mysql import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.base import Base, UUIDMixin
+from src.models.base import Base, SessionRefString, UUIDMixin, UUIDString
 
 if TYPE_CHECKING:
     from src.models.user import Player, Session
@@ -46,6 +46,8 @@ class GameRoom(Base, UUIDMixin):
     is_spectator_mode: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Counters for tracking
+    # current_participant_count is maintained by database triggers on
+    # game_room_participants (migration 004); do not update it from Python.
     current_participant_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     ai_agent_counter: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
@@ -116,17 +118,17 @@ class GameRoomParticipant(Base, UUIDMixin):
     __tablename__ = "game_room_participants"
 
     game_room_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDString,
         ForeignKey("game_rooms.id", ondelete="CASCADE"),
         nullable=False
     )
     player_id: Mapped[Optional[str]] = mapped_column(
-        String(36),
+        UUIDString,
         ForeignKey("players.id", ondelete="SET NULL"),
         nullable=True
     )
     session_id: Mapped[Optional[str]] = mapped_column(
-        String(128),
+        SessionRefString,
         ForeignKey("sessions.id", ondelete="SET NULL"),
         nullable=True
     )
@@ -165,7 +167,7 @@ class GameState(Base, UUIDMixin):
     __tablename__ = "game_states"
 
     game_room_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDString,
         ForeignKey("game_rooms.id", ondelete="CASCADE"),
         unique=True,
         nullable=False
@@ -173,7 +175,7 @@ class GameState(Base, UUIDMixin):
     current_phase: Mapped[str] = mapped_column(String(50), default="setup", nullable=False)
     current_turn: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)  # Deprecated: use current_turn_player_id
     current_turn_player_id: Mapped[Optional[str]] = mapped_column(
-        String(36),
+        UUIDString,
         ForeignKey("players.id", ondelete="SET NULL"),
         nullable=True
     )
@@ -222,7 +224,7 @@ class GameSession(Base, UUIDMixin):
 
     # Foreign keys
     game_room_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDString,
         ForeignKey("game_rooms.id", ondelete="CASCADE"),
         nullable=False,
         index=True
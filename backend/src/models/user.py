@@ -13,7 +13,7 @@ from sqlalchemy import Boolean, ForeignKey, Integer, String
 from sqlalchemy.dialects.mysql import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.base import Base, UUIDMixin
+from src.models.base import Base, UUIDMixin, UUIDString
 
 
 # =============================================================================
@@ -76,7 +76,7 @@ class PlayerProfile(Base):
     __tablename__ = "player_profiles"
 
     player_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDString,
         ForeignKey("players.id", ondelete="CASCADE"),
         primary_key=True
     )
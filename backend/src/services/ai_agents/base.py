@@ -6,7 +6,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, AsyncIterator, Dict, List, Optional
 
-from src.integrations.llm_client import LLMClient
+from src.integrations.llm_client import LLMClient, get_llm_client
 from src.services.ai_agents.prompts.game_rules import ROLE_NAMES, TEAM_NAMES
 
 logger = logging.getLogger(__name__)
@@ -38,7 +38,7 @@ class BaseWerewolfAgent(ABC):
         self.player_id = player_id
         self.player_name = player_name
         self.seat_number = seat_number
-        self.llm_client = llm_client or LLMClient()
+        self.llm_client = llm_client or get_llm_client()
 
         # Game state tracking
         self.is_alive = True
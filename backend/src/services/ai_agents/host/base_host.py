@@ -5,7 +5,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, AsyncIterator, Dict, Optional
 
-from src.integrations.llm_client import LLMClient
+from src.integrations.llm_client import LLMClient, get_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +30,7 @@ class BaseGameHost(ABC):
 
         :param llm_client: LLM client for generating announcements.
         """
-        self.llm_client = llm_client or LLMClient()
+        self.llm_client = llm_client or get_llm_client()
 
     @abstractmethod
     def get_system_prompt(self) -> str:
@@ -13,7 +13,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.integrations.llm_client import LLMClient
+from src.integrations.llm_client import LLMClient, get_llm_client
 from src.models.game import GameRoom, GameRoomParticipant
 from src.utils.logging_config import get_logger
 
@@ -49,12 +49,15 @@ class AIAgentService:
 
     def __init__(self, db: AsyncSession, llm_client: Optional[LLMClient] = None):
         self.db = db
-        self.llm_client = llm_client or LLMClient()
+        self.llm_client = llm_client or get_llm_client()
 
     async def fill_empty_slots(self, room: GameRoom) -> list[GameRoomParticipant]:
         """
         Fill empty player slots with AI agents.
         
+        New participants are appended to ``room.participants`` in-session,
+        so callers see them without refreshing the room.
+
         Args:
             room: Game room to fill
             
@@ -80,7 +83,7 @@ class AIAgentService:
                 is_ai_agent=True,
                 ai_personality=personality
             )
-            self.db.add(participant)
+            room.participants.append(participant)
             ai_participants.append(participant)
 
         await self.db.commit()
@@ -2,9 +2,13 @@
 
 单人模式：所有玩家都是 AI 代理，用户可以选择观战或参与。
 """
+import base64
+import binascii
+import uuid
+from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, and_, func, inspect, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -20,6 +24,38 @@ from src.utils.errors import (
 from src.utils.helpers import generate_room_code
 
 
+def encode_room_cursor(room) -> str:
+    """Encode a room's position in the list order as an opaque cursor.
+
+    Args:
+        room: Last room (or list row) of the current page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{room.created_at.isoformat()}|{room.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_room_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by encode_room_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        (created_at, id) of the last room of the previous page
+
+    Raises:
+        BadRequestError: If the cursor is malformed
+    """
+    try:
+        created_at, room_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), room_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestError("Invalid cursor") from None
+
+
 class GameRoomService:
     """Service for managing game rooms in single-player environment.
     
@@ -85,15 +121,14 @@ class GameRoomService:
             max_players=max_players,
             min_players=min_players,
             user_role=user_role,
-            is_spectator_mode=is_spectator_mode
+            is_spectator_mode=is_spectator_mode,
+            participants=[],  # 新房间没有参与者，直接初始化集合，无需再查询
         )
         self.db.add(room)
         await self.db.commit()
-        await self.db.refresh(room)
-
-        # Load relationships
-        await self.db.refresh(room, ["participants"])
 
+        # 所有列默认值都在 Python 端生成，flush 时已写回对象，会话
+        # expire_on_commit=False，提交后无需 refresh
         return room
 
     async def get_room(self, room_code: str) -> GameRoom:
@@ -108,10 +143,12 @@ class GameRoomService:
         Raises:
             NotFoundError: If room not found
         """
+        # 两条查询：房间本身 + 参与者 LEFT JOIN players（参与者与玩家一对一，
+        # 用 JOIN 而不是再发一条 selectin 查询）
         result = await self.db.execute(
             select(GameRoom)
             .options(
-                selectinload(GameRoom.participants).selectinload(
+                selectinload(GameRoom.participants).joinedload(
                     GameRoomParticipant.player
                 )
             )
@@ -124,43 +161,117 @@ class GameRoomService:
 
         return room
 
+    @staticmethod
+    def _room_filters(
+        status: Optional[str] = None,
+        game_type_slug: Optional[str] = None
+    ) -> list:
+        """Build the WHERE clauses shared by list_rooms and count_rooms."""
+        filters = []
+        if status:
+            filters.append(GameRoom.status == status)
+        if game_type_slug:
+            filters.append(GameRoom.game_type_id == game_type_slug)
+        return filters
+
+    # Columns returned by list_rooms; the list view never needs the rest
+    _LIST_COLUMNS = (
+        GameRoom.id,
+        GameRoom.code,
+        GameRoom.game_type_id,
+        GameRoom.status,
+        GameRoom.max_players,
+        GameRoom.min_players,
+        GameRoom.created_at,
+        GameRoom.started_at,
+        GameRoom.completed_at,
+    )
+
     async def list_rooms(
         self,
         status: Optional[str] = None,
         game_type_slug: Optional[str] = None,
-        limit: int = 20
-    ) -> List[GameRoom]:
-        """List game rooms with optional filtering.
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> List[Row]:
+        """List game rooms with optional filtering, newest first.
         
         Args:
             status: Filter by room status
             game_type_slug: Filter by game type
             limit: Maximum number of rooms to return
+            cursor: Cursor from encode_room_cursor() of the previous page's
+                last room; rooms after it are returned
             
         Returns:
-            List of game rooms
+            Read-only rows with the room list columns plus
+            ``active_participant_count``
+
+        Raises:
+            BadRequestError: If the cursor is malformed
+
+        Note:
+            列表只需要每个房间的活跃人数：在同一条查询中 LEFT JOIN 参与者并
+            GROUP BY 计数，不再加载参与者行。只查询列表所需的列并返回行元组，
+            不构造 ORM 对象，也不进入 identity map。
+
+            分页使用 (created_at, id) 键集游标而非 OFFSET，翻页代价与页码无关。
         """
-        query = select(GameRoom).options(
-            selectinload(GameRoom.participants)
+        query = (
+            select(
+                *self._LIST_COLUMNS,
+                func.count(GameRoomParticipant.id).label("active_participant_count"),
+            )
+            .outerjoin(
+                GameRoomParticipant,
+                and_(
+                    GameRoomParticipant.game_room_id == GameRoom.id,
+                    GameRoomParticipant.left_at.is_(None),
+                ),
+            )
+            .where(*self._room_filters(status, game_type_slug))
+            .group_by(GameRoom.id)
         )
 
-        if status:
-            query = query.where(GameRoom.status == status)
-
-        if game_type_slug:
-            query = query.where(GameRoom.game_type_id == game_type_slug)
+        if cursor:
+            created_at, room_id = decode_room_cursor(cursor)
+            query = query.where(
+                or_(
+                    GameRoom.created_at < created_at,
+                    and_(GameRoom.created_at == created_at, GameRoom.id < room_id),
+                )
+            )
 
-        query = query.limit(limit).order_by(GameRoom.created_at.desc())
+        query = query.order_by(GameRoom.created_at.desc(), GameRoom.id.desc()).limit(limit)
 
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
+
+    async def count_rooms(
+        self,
+        status: Optional[str] = None,
+        game_type_slug: Optional[str] = None
+    ) -> int:
+        """Count game rooms matching the list filters.
+
+        Args:
+            status: Filter by room status
+            game_type_slug: Filter by game type
+
+        Returns:
+            Number of matching rooms
+        """
+        result = await self.db.execute(
+            select(func.count(GameRoom.id)).where(*self._room_filters(status, game_type_slug))
+        )
+        return result.scalar_one()
 
     async def create_ai_agent(
         self,
         room_id: str,
         personality_type: str = "balanced",
         difficulty_level: int = 3
-    ) -> Player:
+    ) -> GameRoomParticipant:
         """Create an AI agent and add to room.
         
         Args:
@@ -169,7 +280,7 @@ class GameRoomService:
             difficulty_level: AI difficulty level (1-5)
             
         Returns:
-            Created AI player
+            Created AI participant (with ``player`` loaded)
         """
         # Get room
         result = await self.db.execute(
@@ -180,40 +291,67 @@ class GameRoomService:
         if not room:
             raise NotFoundError("Room not found")
 
-        # Create AI player with unique name (room code + counter + uuid suffix)
-        import uuid
-        room.ai_agent_counter += 1
-        ai_name = f"AI-{room.code}-{room.ai_agent_counter}-{uuid.uuid4().hex[:6]}"
-
-        ai_player = Player(
-            username=ai_name,
-            is_guest=True
+        participants = await self.create_ai_agents_bulk(
+            room, 1, personality_type=personality_type, difficulty_level=difficulty_level
         )
-        self.db.add(ai_player)
-        await self.db.flush()
+        return participants[0]
 
-        # Create participant
-        participant = GameRoomParticipant(
-            game_room_id=room.id,
-            player_id=ai_player.id,
-            is_ai_agent=True,
-            ai_personality=personality_type
-        )
-        self.db.add(participant)
+    async def create_ai_agents_bulk(
+        self,
+        room: GameRoom,
+        count: int,
+        personality_type: str = "balanced",
+        difficulty_level: int = 3
+    ) -> List[GameRoomParticipant]:
+        """Create several AI agents in a room with a single flush.
 
-        # Create AI agent record
-        ai_agent = AIAgent(
-            username=ai_player.username,
-            personality_type=personality_type,
-            difficulty_level=difficulty_level
-        )
-        self.db.add(ai_agent)
+        主键在 Python 端生成，所有行一起 flush：每张表一条批量 INSERT，
+        而不是每个 AI 单独 INSERT + flush + commit。
+        如果 ``room.participants`` 已加载，新参与者会直接追加到集合中，
+        调用方无需重新加载房间。
+
+        Args:
+            room: Room to add the agents to
+            count: Number of agents to create
+            personality_type: AI personality type
+            difficulty_level: AI difficulty level (1-5)
+
+        Returns:
+            Created AI participants (with ``player`` loaded)
+        """
+        if count <= 0:
+            return []
+
+        participants_loaded = "participants" not in inspect(room).unloaded
+        participants = []
+        for _ in range(count):
+            # Unique name: room code + counter + uuid suffix
+            room.ai_agent_counter += 1
+            ai_name = f"AI-{room.code}-{room.ai_agent_counter}-{uuid.uuid4().hex[:6]}"
+
+            ai_player = Player(
+                username=ai_name,
+                is_guest=True
+            )
+            participant = GameRoomParticipant(
+                game_room_id=room.id,
+                player=ai_player,
+                is_ai_agent=True,
+                ai_personality=personality_type
+            )
+            ai_agent = AIAgent(
+                username=ai_name,
+                personality_type=personality_type,
+                difficulty_level=difficulty_level
+            )
+            self.db.add_all([ai_player, participant, ai_agent])
+            participants.append(participant)
+            if participants_loaded:
+                room.participants.append(participant)
 
         await self.db.commit()
-        await self.db.refresh(ai_player)
-        await self.db.refresh(participant)
 
-        return participant
+        return participants
 
     async def remove_ai_agent(self, room_code: str, agent_id: str):
         """Remove an AI agent from room.
@@ -242,22 +380,24 @@ class GameRoomService:
             raise NotFoundError("AI agent not found in room")
 
         # Mark as left
-        from datetime import datetime
         participant.left_at = datetime.utcnow()
         await self.db.commit()
 
-    async def start_game(self, room_code: str) -> GameRoom:
+    async def start_game(self, room_code: str, room: Optional[GameRoom] = None) -> GameRoom:
         """Start a game.
         
         单人模式下无需验证房主，任何人都可以开始游戏。
         
         Args:
             room_code: Room code
+            room: Room already loaded by the caller with get_room; loaded
+                by code if omitted
             
         Returns:
             Updated room
         """
-        room = await self.get_room(room_code)
+        if room is None:
+            room = await self.get_room(room_code)
 
         if room.status != "Waiting":
             raise GameAlreadyStartedError("Game already started")
@@ -278,11 +418,55 @@ class GameRoomService:
         )
         self.db.add(game_state)
 
+        # status/started_at 已在对象上设置，参与者由 get_room 加载；
+        # 会话 expire_on_commit=False，提交后无需 refresh 重新加载整张图
         await self.db.commit()
-        await self.db.refresh(room)
 
         return room
 
+    async def update_status(
+        self,
+        room_code: str,
+        allowed_statuses: tuple[str, ...],
+        new_status: str,
+        **values
+    ) -> bool:
+        """Change a room's status without loading the room graph.
+
+        前置状态检查放在 UPDATE 的 WHERE 条件里：一次往返完成检查和修改，
+        并发请求也不会基于过期的状态读取互相覆盖。仅在没有行被修改时
+        才额外查询房间是否存在，以区分 404 和状态不符。
+
+        Args:
+            room_code: Room code
+            allowed_statuses: Statuses the room may currently be in
+            new_status: Status to set
+            **values: Extra columns to set (e.g. completed_at)
+
+        Returns:
+            False if the room is not in one of the allowed statuses
+        """
+        result = await self.db.execute(
+            update(GameRoom)
+            .where(
+                GameRoom.code == room_code,
+                GameRoom.status.in_(allowed_statuses)
+            )
+            .values(status=new_status, **values)
+        )
+
+        if result.rowcount == 0:
+            exists = await self.db.scalar(
+                select(GameRoom.id).where(GameRoom.code == room_code)
+            )
+            if exists is None:
+                raise NotFoundError(f"Room {room_code} not found")
+            return False
+
+        await self.db.commit()
+
+        return True
+
     async def delete_room(self, room_code: str):
         """Delete a room (only for Waiting status).
         
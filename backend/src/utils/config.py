@@ -85,6 +85,10 @@ class Settings(BaseSettings):
 
     # SQLAlchemy
     SQLALCHEMY_ECHO: bool = False
+    DB_POOL_SIZE: int = 5  # Persistent connections kept in the pool
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed under burst load
+    DB_POOL_RECYCLE: int = 3600  # Recycle connections older than this (seconds)
+    DB_POOL_PRE_PING: bool = False  # Test connections on checkout (one extra round-trip)
     
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
@@ -0,0 +1,25 @@
+"""CORS middleware for the HTTP API."""
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class APICORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that leaves mounted sub-apps with their own CORS policy.
+
+    Socket.IO is mounted under the FastAPI app, so its HTTP long-polling
+    requests would otherwise pass through this middleware too. engineio
+    already validates origins and sets CORS headers itself
+    (``cors_allowed_origins``); applying both layers rejects origins that
+    engineio accepts and duplicates ``Access-Control-Allow-Origin`` on
+    allowed ones.
+    """
+
+    def __init__(self, app, excluded_prefixes: tuple[str, ...] = (), **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.excluded_prefixes = excluded_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.excluded_prefixes):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
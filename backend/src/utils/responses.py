@@ -0,0 +1,18 @@
+"""JSON response classes backed by orjson."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes with orjson.
+
+    orjson encodes straight to bytes in C and handles datetime/UUID
+    natively, so small payloads avoid the stdlib ``json`` overhead.
+    FastAPI's own ``ORJSONResponse`` is deprecated in newer releases,
+    so the app uses this subclass instead.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
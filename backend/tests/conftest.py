@@ -1,10 +1,12 @@
 """Pytest configuration and fixtures."""
 import asyncio
 import os
+from contextlib import contextmanager
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import text
+from sqlalchemy import event, text
 
 from src.models.base import Base
 from src.models.user import Player, PlayerProfile
@@ -64,6 +66,32 @@ async def test_db(test_engine):
         await session.rollback()
 
 
+@pytest.fixture
+def capture_statements(test_engine):
+    """Return a context manager that records SQL sent to the test engine.
+
+    Usage::
+
+        with capture_statements() as statements:
+            await service.get_room(code)
+        assert len(statements) == 2
+    """
+    @contextmanager
+    def capture():
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    return capture
+
+
 @pytest.fixture
 async def sample_game_type():
     """Return a sample game type from constants for testing."""
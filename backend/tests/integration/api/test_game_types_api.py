@@ -0,0 +1,72 @@
+"""Integration tests for the game type endpoints."""
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+
+
+@pytest.fixture
+async def client():
+    """Create a test HTTP client (game types need no database)."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+class TestListGamesCaching:
+    """Test HTTP caching headers on GET /api/v1/games."""
+
+    async def test_list_games_sets_etag_and_cache_control(self, client: AsyncClient):
+        """Test that the list response is cacheable."""
+        response = await client.get("/api/v1/games")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert "max-age" in response.headers["cache-control"]
+        assert len(response.json()) > 0
+
+    async def test_list_games_not_modified(self, client: AsyncClient):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        etag = (await client.get("/api/v1/games")).headers["etag"]
+
+        response = await client.get("/api/v1/games", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    async def test_list_games_etag_is_stable(self, client: AsyncClient):
+        """Test that repeated requests get the same ETag."""
+        first = await client.get("/api/v1/games")
+        second = await client.get("/api/v1/games")
+
+        assert first.headers["etag"] == second.headers["etag"]
+
+    async def test_list_games_available_only(self, client: AsyncClient):
+        """Test that available_only serves its own preserialized list."""
+        response = await client.get("/api/v1/games", params={"available_only": True})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert all(game["is_available"] for game in response.json())
+
+
+@pytest.mark.asyncio
+class TestGetRoles:
+    """Test GET /api/v1/games/{slug}/roles."""
+
+    async def test_get_roles(self, client: AsyncClient):
+        """Test that the role list is returned for a known game type."""
+        response = await client.get("/api/v1/games/werewolf/roles")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["roles"]) > 0
+        assert data["supports_spectating"] is True
+
+    async def test_get_roles_unknown_game(self, client: AsyncClient):
+        """Test that an unknown game type returns 404."""
+        response = await client.get("/api/v1/games/unknown-game/roles")
+
+        assert response.status_code == 404
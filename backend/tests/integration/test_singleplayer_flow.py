@@ -5,9 +5,13 @@
 - 角色选择功能
 - 游戏控制功能
 """
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from main import app
@@ -69,6 +73,39 @@ class TestSinglePlayerGameFlow:
         ai_participants = result.scalars().all()
         assert len(ai_participants) >= 4
 
+    async def test_start_game_broadcast_payload(
+        self,
+        client: AsyncClient,
+        sample_game_type
+    ):
+        """Test the game_started broadcast payload."""
+        create_response = await client.post(
+            "/api/v1/rooms",
+            json={
+                "game_type_slug": sample_game_type["slug"],
+                "max_players": 10,
+                "min_players": 10
+            }
+        )
+        room_code = create_response.json()["code"]
+
+        with patch(
+            "src.api.game_routes.ws_handlers.broadcast_game_started",
+            new_callable=AsyncMock,
+        ) as broadcast:
+            start_response = await client.post(f"/api/v1/rooms/{room_code}/start")
+
+        assert start_response.status_code == 200
+        broadcast.assert_awaited_once()
+        sent_code, game_data = broadcast.await_args.args
+        assert sent_code == room_code
+        assert game_data["game_type"] == {
+            "name": sample_game_type["name"],
+            "slug": sample_game_type["slug"],
+        }
+        assert len(game_data["participants"]) == 10
+        datetime.fromisoformat(game_data["started_at"])
+
     async def test_room_list_and_get(
         self,
         client: AsyncClient,
@@ -103,6 +140,35 @@ class TestSinglePlayerGameFlow:
         room_details = get_response.json()
         assert room_details["code"] == room_code
 
+    async def test_room_list_total_on_first_page_only(
+        self,
+        client: AsyncClient,
+        sample_game_type
+    ):
+        """Test that total is returned on the first page and omitted when paging."""
+        for _ in range(3):
+            await client.post(
+                "/api/v1/rooms",
+                json={
+                    "game_type_slug": sample_game_type["slug"],
+                    "max_players": 10,
+                    "min_players": 10
+                }
+            )
+
+        first_page = (await client.get("/api/v1/rooms", params={"limit": 2})).json()
+        assert first_page["total"] == 3
+        assert first_page["next_cursor"]
+
+        second_page = (
+            await client.get(
+                "/api/v1/rooms",
+                params={"limit": 2, "cursor": first_page["next_cursor"]}
+            )
+        ).json()
+        assert second_page["total"] is None
+        assert len(second_page["rooms"]) == 1
+
 
 @pytest.mark.asyncio
 class TestRoleSelection:
@@ -181,15 +247,88 @@ class TestRoleSelection:
         # Select participant role
         select_response = await client.post(
             f"/api/v1/rooms/{room_code}/select-role",
-            json={"is_spectator": False, "role_id": "detective"}
+            json={
+                "is_spectator": False,
+                "role_id": "detective",
+                "player_id": "00000000-0000-0000-0000-000000000001"
+            }
         )
         assert select_response.status_code == 200
+        selected = select_response.json()
+        assert selected["current_player_count"] == 10
+        assert len(selected["participants"]) == 10
         
         # Verify room is not in spectator mode
         get_response = await client.get(f"/api/v1/rooms/{room_code}")
         room_data = get_response.json()
         assert room_data["user_role"] == "detective"
         assert room_data["is_spectator_mode"] is False
+        assert room_data["current_player_count"] == 10
+
+    async def test_select_role_ai_fill_failure(
+        self,
+        client: AsyncClient,
+        test_db: AsyncSession,
+        sample_game_type
+    ):
+        """Test that a failed AI fill returns 500 and adds no AI agents."""
+        create_response = await client.post(
+            "/api/v1/rooms",
+            json={
+                "game_type_slug": sample_game_type["slug"],
+                "max_players": 10,
+                "min_players": 10
+            }
+        )
+        room_data = create_response.json()
+
+        with patch(
+            "src.api.game_routes.GameRoomService.create_ai_agents_bulk",
+            new_callable=AsyncMock,
+            side_effect=SQLAlchemyError("insert failed"),
+        ):
+            select_response = await client.post(
+                f"/api/v1/rooms/{room_data['code']}/select-role",
+                json={"is_spectator": True}
+            )
+
+        assert select_response.status_code == 500
+        result = await test_db.execute(
+            select(GameRoomParticipant).where(
+                GameRoomParticipant.game_room_id == room_data["id"],
+                GameRoomParticipant.is_ai_agent == True
+            )
+        )
+        assert result.scalars().all() == []
+
+    async def test_select_role_twice_keeps_single_human(
+        self,
+        client: AsyncClient,
+        sample_game_type
+    ):
+        """Test that re-selecting a role does not add a second human participant."""
+        create_response = await client.post(
+            "/api/v1/rooms",
+            json={
+                "game_type_slug": sample_game_type["slug"],
+                "max_players": 10,
+                "min_players": 10
+            }
+        )
+        room_code = create_response.json()["code"]
+        payload = {
+            "is_spectator": False,
+            "role_id": "detective",
+            "player_id": "00000000-0000-0000-0000-000000000002"
+        }
+
+        await client.post(f"/api/v1/rooms/{room_code}/select-role", json=payload)
+        second = await client.post(f"/api/v1/rooms/{room_code}/select-role", json=payload)
+
+        assert second.status_code == 200
+        participants = second.json()["participants"]
+        assert len(participants) == 10
+        assert sum(1 for p in participants if not p["is_ai_agent"]) == 1
 
 
 @pytest.mark.asyncio
@@ -332,12 +471,38 @@ class TestAIAgentManagement:
         # Add AI agent
         add_response = await client.post(f"/api/v1/rooms/{room_code}/ai-agents")
         assert add_response.status_code == 201
+        ai_agent = add_response.json()["ai_agent"]
+        datetime.fromisoformat(ai_agent["created_at"])
+        datetime.fromisoformat(ai_agent["last_active"])
         
         # Verify AI agent was added
         get_response = await client.get(f"/api/v1/rooms/{room_code}")
         room_data = get_response.json()
         assert len(room_data["participants"]) > 0
 
+    async def test_add_ai_agent_to_full_room(
+        self,
+        client: AsyncClient,
+        sample_game_type
+    ):
+        """Test that capacity is checked against the active participants."""
+        create_response = await client.post(
+            "/api/v1/rooms",
+            json={
+                "game_type_slug": sample_game_type["slug"],
+                "max_players": 10,
+                "min_players": 10
+            }
+        )
+        room_code = create_response.json()["code"]
+
+        for _ in range(10):
+            add_response = await client.post(f"/api/v1/rooms/{room_code}/ai-agents")
+            assert add_response.status_code == 201
+
+        full_response = await client.post(f"/api/v1/rooms/{room_code}/ai-agents")
+        assert full_response.status_code == 409
+
     async def test_remove_ai_agent(
         self,
         client: AsyncClient,
@@ -362,4 +527,33 @@ class TestAIAgentManagement:
         
         # Remove AI agent
         remove_response = await client.delete(f"/api/v1/rooms/{room_code}/ai-agents/{agent_id}")
-        assert remove_response.status_code == 204
\ No newline at end of file
+        assert remove_response.status_code == 204
+
+    async def test_remove_ai_agent_broadcasts_after_response(
+        self,
+        client: AsyncClient,
+        sample_game_type
+    ):
+        """Test that the removal broadcast still runs as a background task."""
+        create_response = await client.post(
+            "/api/v1/rooms",
+            json={
+                "game_type_slug": sample_game_type["slug"],
+                "max_players": 10,
+                "min_players": 10
+            }
+        )
+        room_code = create_response.json()["code"]
+        add_response = await client.post(f"/api/v1/rooms/{room_code}/ai-agents")
+        agent_id = add_response.json()["ai_agent"]["id"]
+
+        with patch(
+            "src.api.game_routes.ws_handlers.broadcast_ai_agent_removed",
+            new_callable=AsyncMock,
+        ) as broadcast:
+            remove_response = await client.delete(
+                f"/api/v1/rooms/{room_code}/ai-agents/{agent_id}"
+            )
+
+        assert remove_response.status_code == 204
+        broadcast.assert_awaited_once_with(room_code, agent_id, None)
@@ -0,0 +1,57 @@
+"""Integration tests for Socket.IO mounted on the FastAPI app."""
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import CORS_ORIGINS, app
+
+OUTSIDE_ORIGIN = "http://outside.example"
+
+
+@pytest.fixture
+async def client():
+    """Create a test HTTP client against the app uvicorn serves."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+class TestSocketApp:
+    """Test request routing and CORS on main:app."""
+
+    async def test_cross_origin_polling_handshake(self, client: AsyncClient):
+        """Test that Socket.IO polling accepts origins outside CORS_ORIGINS."""
+        assert OUTSIDE_ORIGIN not in CORS_ORIGINS
+
+        preflight = await client.options(
+            "/socket.io/?EIO=4&transport=polling",
+            headers={"Origin": OUTSIDE_ORIGIN, "Access-Control-Request-Method": "GET"},
+        )
+        handshake = await client.get(
+            "/socket.io/?EIO=4&transport=polling",
+            headers={"Origin": OUTSIDE_ORIGIN},
+        )
+
+        assert preflight.status_code == 200
+        assert handshake.status_code == 200
+        assert handshake.text.startswith("0{")
+        assert handshake.headers.get_list("access-control-allow-origin") == [OUTSIDE_ORIGIN]
+
+    async def test_allowed_origin_polling_single_cors_header(self, client: AsyncClient):
+        """Test that API CORS does not add a second header to Socket.IO responses."""
+        handshake = await client.get(
+            "/socket.io/?EIO=4&transport=polling",
+            headers={"Origin": CORS_ORIGINS[0]},
+        )
+
+        assert handshake.status_code == 200
+        assert handshake.headers.get_list("access-control-allow-origin") == [CORS_ORIGINS[0]]
+
+    async def test_api_requests_reach_fastapi(self, client: AsyncClient):
+        """Test that API routes keep FastAPI's CORS policy."""
+        allowed = await client.get("/api/v1/health", headers={"Origin": CORS_ORIGINS[0]})
+        outside = await client.get("/api/v1/health", headers={"Origin": OUTSIDE_ORIGIN})
+
+        assert allowed.status_code == 200
+        assert allowed.headers["access-control-allow-origin"] == CORS_ORIGINS[0]
+        assert "access-control-allow-origin" not in outside.headers
@@ -5,10 +5,12 @@
 - 所有玩家都是 AI 代理
 - 用户可以选择观战或参与
 """
+from datetime import datetime
+
 import pytest
 from sqlalchemy import select
 
-from src.services.game_room_service import GameRoomService
+from src.services.game_room_service import GameRoomService, encode_room_cursor
 from src.models.game import GameRoom, GameRoomParticipant, GameState
 from src.utils.errors import NotFoundError, BadRequestError, GameAlreadyStartedError
 
@@ -99,6 +101,18 @@ class TestGameRoomServiceGet:
         assert room.id == sample_game_room.id
         assert room.code == sample_game_room.code
     
+    async def test_get_room_query_count(self, test_db, capture_statements, sample_game_room):
+        """Test that get_room loads room, participants and players in two queries."""
+        service = GameRoomService(test_db)
+        test_db.expunge_all()
+
+        with capture_statements() as statements:
+            room = await service.get_room(sample_game_room.code)
+            players = [p.player for p in room.participants]
+
+        assert len(statements) == 2
+        assert all(player is not None for player in players)
+
     async def test_get_room_not_found(self, test_db):
         """Test getting a nonexistent room."""
         service = GameRoomService(test_db)
@@ -162,6 +176,60 @@ class TestGameRoomServiceList:
         
         assert len(rooms) == 3
 
+    async def test_list_rooms_cursor_pagination(self, test_db, sample_game_type):
+        """Test that cursor pages cover every room exactly once, newest first."""
+        service = GameRoomService(test_db)
+
+        created = [await service.create_room(sample_game_type["slug"], 10, 10) for _ in range(5)]
+
+        first_page = await service.list_rooms(limit=2)
+        second_page = await service.list_rooms(limit=2, cursor=encode_room_cursor(first_page[-1]))
+        third_page = await service.list_rooms(limit=2, cursor=encode_room_cursor(second_page[-1]))
+
+        codes = [r.code for r in first_page + second_page + third_page]
+        assert len(third_page) == 1
+        assert sorted(codes) == sorted(r.code for r in created)
+        keys = [(r.created_at, r.id) for r in first_page + second_page + third_page]
+        assert keys == sorted(keys, reverse=True)
+
+    async def test_list_rooms_invalid_cursor(self, test_db):
+        """Test that a malformed cursor is rejected."""
+        service = GameRoomService(test_db)
+
+        with pytest.raises(BadRequestError):
+            await service.list_rooms(cursor="not-a-cursor")
+
+    async def test_count_rooms(self, test_db, sample_game_type):
+        """Test counting rooms with the list filters."""
+        service = GameRoomService(test_db)
+
+        await service.create_room(sample_game_type["slug"], 10, 10)
+        room = await service.create_room(sample_game_type["slug"], 10, 10)
+        room.status = "In Progress"
+        await test_db.commit()
+
+        assert await service.count_rooms() == 2
+        assert await service.count_rooms(status="Waiting") == 1
+
+    async def test_list_rooms_counts_active_participants_in_sql(self, test_db, sample_game_room):
+        """Test that list_rooms returns plain rows with the active count computed in SQL."""
+        service = GameRoomService(test_db)
+        test_db.add(GameRoomParticipant(
+            game_room_id=sample_game_room.id,
+            is_ai_agent=True,
+            left_at=datetime.utcnow(),
+        ))
+        await test_db.commit()
+        test_db.expunge_all()
+
+        rooms = await service.list_rooms()
+        room = next(r for r in rooms if r.code == sample_game_room.code)
+
+        assert room.active_participant_count == 1
+        assert not isinstance(room, GameRoom)
+        assert not hasattr(room, "participants")
+        assert not test_db.identity_map
+
 
 @pytest.mark.asyncio
 class TestGameRoomServiceAI:
@@ -183,6 +251,39 @@ class TestGameRoomServiceAI:
         assert "AI" in participant.player.username
         assert participant.player.is_guest is True
     
+    async def test_create_ai_agents_bulk(self, test_db, sample_game_room):
+        """Test creating several AI agents at once."""
+        service = GameRoomService(test_db)
+
+        participants = await service.create_ai_agents_bulk(sample_game_room, 3)
+
+        assert len(participants) == 3
+        assert all(p.is_ai_agent and p.player.is_guest for p in participants)
+        assert len({p.player.username for p in participants}) == 3
+
+        stmt = select(GameRoomParticipant).where(
+            GameRoomParticipant.game_room_id == sample_game_room.id,
+            GameRoomParticipant.is_ai_agent == True
+        )
+        result = await test_db.execute(stmt)
+        assert len(result.scalars().all()) == 3
+
+    async def test_create_ai_agents_bulk_updates_loaded_room(self, test_db, sample_game_room):
+        """Test that new agents are appended to an already-loaded room."""
+        service = GameRoomService(test_db)
+        room = await service.get_room(sample_game_room.code)
+        before = room.get_active_participants_count()
+
+        await service.create_ai_agents_bulk(room, 2)
+
+        assert room.get_active_participants_count() == before + 2
+
+    async def test_create_ai_agents_bulk_zero(self, test_db, sample_game_room):
+        """Test that a non-positive count creates nothing."""
+        service = GameRoomService(test_db)
+
+        assert await service.create_ai_agents_bulk(sample_game_room, 0) == []
+
     async def test_fill_ai_players(self, test_db, sample_game_room):
         """Test auto-filling room with AI players."""
         service = GameRoomService(test_db)
@@ -247,6 +348,19 @@ class TestGameRoomServiceStart:
         
         assert game_state is not None
     
+    async def test_start_game_with_loaded_room(self, test_db, capture_statements, sample_game_room):
+        """Test starting a game with a room the caller already loaded."""
+        service = GameRoomService(test_db)
+        await service.fill_ai_players(sample_game_room)
+        room = await service.get_room(sample_game_room.code)
+
+        with capture_statements() as statements:
+            started = await service.start_game(room.code, room=room)
+
+        assert started is room
+        assert room.status == "In Progress"
+        assert not any(s.lstrip().upper().startswith("SELECT") for s in statements)
+
     async def test_start_game_not_enough_players(self, test_db, sample_game_room):
         """Test starting a game with not enough players fails."""
         service = GameRoomService(test_db)
@@ -268,6 +382,73 @@ class TestGameRoomServiceStart:
             await service.start_game(sample_game_room.code)
 
 
+@pytest.mark.asyncio
+class TestGameRoomServiceUpdateStatus:
+    """Test GameRoomService.update_status method."""
+
+    async def test_update_status_allowed(self, test_db, sample_game_room):
+        """Test changing status from an allowed status."""
+        service = GameRoomService(test_db)
+
+        updated = await service.update_status(
+            sample_game_room.code, ("Waiting",), "Paused"
+        )
+
+        assert updated is True
+        result = await test_db.execute(
+            select(GameRoom.status).where(GameRoom.id == sample_game_room.id)
+        )
+        assert result.scalar_one() == "Paused"
+
+    async def test_update_status_sets_extra_values(self, test_db, sample_game_room):
+        """Test that extra column values are written with the status."""
+        service = GameRoomService(test_db)
+        completed_at = datetime(2026, 1, 1, 12, 0, 0)
+
+        await service.update_status(
+            sample_game_room.code, ("Waiting",), "Completed", completed_at=completed_at
+        )
+
+        result = await test_db.execute(
+            select(GameRoom.status, GameRoom.completed_at).where(GameRoom.id == sample_game_room.id)
+        )
+        assert tuple(result.one()) == ("Completed", completed_at)
+
+    async def test_update_status_wrong_status(self, test_db, sample_game_room):
+        """Test that a room in another status is left unchanged."""
+        service = GameRoomService(test_db)
+
+        updated = await service.update_status(
+            sample_game_room.code, ("In Progress",), "Paused"
+        )
+
+        assert updated is False
+        result = await test_db.execute(
+            select(GameRoom.status).where(GameRoom.id == sample_game_room.id)
+        )
+        assert result.scalar_one() == "Waiting"
+
+    async def test_update_status_only_first_transition_applies(self, test_db, sample_game_room):
+        """Test that a repeated transition from the same status is rejected."""
+        service = GameRoomService(test_db)
+
+        first = await service.update_status(sample_game_room.code, ("Waiting",), "Paused")
+        second = await service.update_status(sample_game_room.code, ("Waiting",), "Completed")
+
+        assert (first, second) == (True, False)
+        result = await test_db.execute(
+            select(GameRoom.status).where(GameRoom.id == sample_game_room.id)
+        )
+        assert result.scalar_one() == "Paused"
+
+    async def test_update_status_room_not_found(self, test_db):
+        """Test updating a non-existent room raises NotFoundError."""
+        service = GameRoomService(test_db)
+
+        with pytest.raises(NotFoundError):
+            await service.update_status("NOTEXIST", ("Waiting",), "Paused")
+
+
 @pytest.mark.asyncio
 class TestGameRoomServiceDelete:
     """Test GameRoomService.delete_room method for single-player mode."""
@@ -1,7 +1,7 @@
 import os
 import pytest
 
-from src.integrations.llm_client import LLMClient
+from src.integrations.llm_client import LLMClient, get_llm_client
 from src.utils.config import settings
 
 
@@ -19,4 +19,34 @@ def test_llm_client_falls_back_to_openai_api_key(monkeypatch):
     # Verify explicit API key passed to constructor takes precedence
     client = LLMClient(api_key="sk-openai-fallback")
 
-    assert client.api_key == "sk-openai-fallback"
\ No newline at end of file
+    assert client.api_key == "sk-openai-fallback"
+
+
+def test_get_llm_client_returns_shared_instance():
+    # Default-configured callers share one client (and its connection pool)
+    assert get_llm_client() is get_llm_client()
+
+
+@pytest.mark.asyncio
+async def test_generate_many_preserves_order_and_limits_concurrency(monkeypatch):
+    import asyncio
+
+    client = LLMClient(api_key="sk-test")
+    in_flight = 0
+    peak = 0
+
+    async def fake_generate(messages, temperature=None, max_tokens=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return messages[0]["content"]
+
+    monkeypatch.setattr(client, "generate", fake_generate)
+
+    batch = [[{"role": "user", "content": str(i)}] for i in range(6)]
+    results = await client.generate_many(batch, concurrency=2)
+
+    assert results == [str(i) for i in range(6)]
+    assert peak == 2
@@ -0,0 +1,44 @@
+"""Unit tests for the Alembic revision graph."""
+from pathlib import Path
+
+import pytest
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def script_directory():
+    """Load the migration scripts without touching a database."""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return ScriptDirectory.from_config(config)
+
+
+class TestRevisionGraph:
+    """Test that migrations form a single linear chain."""
+
+    def test_single_head(self, script_directory):
+        """Test that there is exactly one head revision."""
+        assert len(script_directory.get_heads()) == 1
+
+    def test_single_base(self, script_directory):
+        """Test that there is exactly one base revision."""
+        assert len(script_directory.get_bases()) == 1
+
+    def test_revision_graph_is_linear(self, script_directory):
+        """Test that no revision branches or merges."""
+        revisions = list(script_directory.walk_revisions())
+
+        for revision in revisions:
+            assert not revision.is_merge_point, f"{revision.revision} is a merge point"
+            assert not revision.is_branch_point, f"{revision.revision} is a branch point"
+
+    def test_revisions_are_unique(self, script_directory):
+        """Test that no two migration files declare the same revision."""
+        revisions = [r.revision for r in script_directory.walk_revisions()]
+        assert len(revisions) == len(set(revisions))
+
+        paths = [r.path for r in script_directory.walk_revisions()]
+        assert len(paths) == len(set(paths))
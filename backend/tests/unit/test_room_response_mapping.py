@@ -0,0 +1,63 @@
+"""Unit tests for the room response mappers in game_routes."""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from src.api.game_routes import map_room_to_detailed_response, map_room_to_response
+from src.api.schemas import GameTypeResponse
+
+
+def make_room(game_type_id: str, **extra) -> SimpleNamespace:
+    """Build a room-like object with the columns the mappers read."""
+    return SimpleNamespace(
+        id="00000000-0000-0000-0000-000000000010",
+        code="MAP12345",
+        game_type_id=game_type_id,
+        status="Waiting",
+        max_players=10,
+        min_players=10,
+        created_at=datetime(2026, 1, 1),
+        started_at=None,
+        completed_at=None,
+        **extra,
+    )
+
+
+class TestMapRoomToResponse:
+    """Test map_room_to_response."""
+
+    def test_known_game_type(self):
+        """Test that a known game type maps to its response model."""
+        response = map_room_to_response(make_room("werewolf", active_participant_count=3))
+
+        assert isinstance(response.game_type, GameTypeResponse)
+        assert response.game_type.slug == "werewolf"
+        assert response.current_player_count == 3
+
+    def test_unknown_game_type_fails_validation(self):
+        """Test that an unknown game type is rejected instead of serialized as null."""
+        with pytest.raises(ValidationError):
+            map_room_to_response(make_room("no-such-game", active_participant_count=0))
+
+
+class TestMapRoomToDetailedResponse:
+    """Test map_room_to_detailed_response."""
+
+    def test_known_game_type(self):
+        """Test that a room without participants maps to a detailed response."""
+        room = make_room("werewolf", participants=[], user_role="spectator", is_spectator_mode=True)
+
+        response = map_room_to_detailed_response(room, active_count=0)
+
+        assert response.game_type.slug == "werewolf"
+        assert response.participants == []
+        assert response.is_spectator_mode is True
+
+    def test_unknown_game_type_fails_validation(self):
+        """Test that an unknown game type is rejected instead of serialized as null."""
+        room = make_room("no-such-game", participants=[], user_role=None, is_spectator_mode=None)
+
+        with pytest.raises(ValidationError):
+            map_room_to_detailed_response(room, active_count=0)